@@ -36,18 +36,29 @@ class PushNotifier:
         return True
 
 
+# Placeholder used until a real notifier is injected
+class _NullNotifier:
+    __slots__ = ()
+
+    def send(self, message: str) -> bool:
+        raise ValueError("No notifier configured")
+
+
+_NULL_NOTIFIER = _NullNotifier()
+
+
 # Service class with setter injection
 class NotificationService:
+    __slots__ = ("_notifier",)
+
     def __init__(self):
-        self._notifier: Notifier | None = None
+        self._notifier: Notifier = _NULL_NOTIFIER
 
     def set_notifier(self, notifier: Notifier) -> None:
         """Dependency injection via setter method"""
         self._notifier = notifier
 
     def send_notification(self, message: str) -> bool:
-        if not self._notifier:
-            raise ValueError("No notifier configured")
         return self._notifier.send(message)
 
 
@@ -30,6 +30,8 @@ class MySqlDatabase:
 
 #Service class that depends on the Database protocol/dependency injection.
 class UserService:
+    __slots__ = ("_db",)
+
     def __init__(self, db: Database): #Constructor injection of the Database dependency.
         self._db = db
 